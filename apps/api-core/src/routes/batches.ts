@@ -120,14 +120,18 @@ export const batchRoutes: FastifyPluginAsync = async (server) => {
 
   // Get inventory summary by product
   server.get("/inventory-summary", { preHandler: authenticate }, async (request, reply) => {
-    const { storeId } = request.query as { storeId?: string };
+    const { storeId, skus } = request.query as { storeId?: string; skus?: string };
+    // Optional comma-separated SKU filter, so callers needing a few products
+    // don't transfer the whole store inventory
+    const skuList = skus ? skus.split(",").filter(Boolean) : undefined;
 
     try {
-      // Get all products with their batch information
+      // Get all (or the requested) products with their batch information
       const products = await prisma.product.findMany({
         where: {
           status: "ACTIVE",
           batches: storeId ? { some: { storeId } } : undefined,
+          ...(skuList ? { sku: { in: skuList } } : {}),
         },
         include: {
           category: true,
@@ -8,9 +8,242 @@ Calculates:
 - Multiple scenarios comparison
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime, timedelta
-import math
+from bisect import bisect_left, bisect_right
+from math import ceil as _ceil, floor as _floor
+
+import numpy as np
+
+
+# Numeric kernels: plain scalars/arrays in, tuples out. The classes below
+# only turn their results into response dicts.
+
+# Coverage status by days of stock remaining: below 1 day CRITICAL, below 3
+# URGENT, below 7 LOW, below 30 GOOD, otherwise OVERSTOCKED
+_STATUS_THRESHOLDS = (1, 3, 7, 30)
+_STATUSES = ('CRITICAL', 'URGENT', 'LOW', 'GOOD', 'OVERSTOCKED')
+# Row layout returned by CoverageCalculator.calculate_bulk
+_BULK_DTYPE = np.dtype([
+    ('current_stock', np.float64),
+    ('daily_demand', np.float64),
+    ('days_remaining', np.float64),
+    ('status', 'U11'),
+    ('order_quantity', np.int64),
+    ('final_stock', np.float64),
+    ('actual_coverage_days', np.float64)
+])
+_BULK_STATUSES = np.array(_STATUSES + ('NO_DEMAND',))
+# Message templates take days remaining already formatted to one decimal
+_STATUS_MESSAGES = (
+    'CRITICAL: Stock will run out in %s days',
+    'URGENT: Only %s days of stock remaining',
+    'LOW: %s days of stock remaining',
+    'GOOD: %s days of stock remaining',
+    'OVERSTOCKED: %s days of stock remaining'
+)
+
+
+def _days_remaining(current_stock: float, daily_demand: float, max_days: float) -> float:
+    """Days of stock left at the given demand, capped at max_days"""
+    return min(current_stock / daily_demand, max_days)
+
+
+def _status_index(days_remaining: float) -> int:
+    """Index into _STATUSES for a days_remaining value"""
+    return bisect_right(_STATUS_THRESHOLDS, days_remaining)
+
+
+def _status_indices(days_remaining: np.ndarray) -> np.ndarray:
+    """Vectorized _status_index"""
+    return np.searchsorted(_STATUS_THRESHOLDS, days_remaining, side='right')
+
+
+def _order_with_safety(
+    current_stock: float,
+    daily_demand: float,
+    target_coverage_days: int,
+    safety_factor: float
+) -> Tuple[int, float, float]:
+    """(order_quantity, final_stock, actual_coverage_days) with safety stock applied"""
+    required_stock = daily_demand * target_coverage_days * safety_factor
+    order_quantity = max(0, _ceil(required_stock - current_stock))
+    final_stock = current_stock + order_quantity
+    return order_quantity, final_stock, round(final_stock / daily_demand, 2)
+
+
+def _order_plain(
+    current_stock: float,
+    daily_demand: float,
+    target_coverage_days: int,
+    safety_factor: float = 1.0
+) -> Tuple[int, float, float]:
+    """(order_quantity, final_stock, actual_coverage_days) without safety stock"""
+    required_stock = daily_demand * target_coverage_days
+    order_quantity = max(0, _ceil(required_stock - current_stock))
+    final_stock = current_stock + order_quantity
+    return order_quantity, final_stock, round(final_stock / daily_demand, 2)
+
+
+def _scenario_kernel(
+    current_stock: float,
+    daily_demand: float,
+    periods: np.ndarray,
+    factor: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(order_qty, final_stock, actual_coverage) arrays for all periods at once"""
+    # Same left-to-right product as the scalar kernels, without extra temporaries;
+    # a factor of 1.0 (no safety stock) skips the second multiply
+    required = daily_demand * periods
+    if factor != 1.0:
+        required *= factor
+    required -= current_stock
+    # Never order a negative quantity
+    order_qty = np.maximum(np.ceil(required, out=required), 0).astype(np.int64)
+    final_stock = current_stock + order_qty
+    return order_qty, final_stock, final_stock / daily_demand
+
+
+def _bulk_kernel(
+    current_stocks: np.ndarray,
+    daily_demands: np.ndarray,
+    target_days: np.ndarray,
+    safety_factors: np.ndarray,
+    max_days: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (has_demand, days_remaining, order_qty, final_stock, actual_coverage) for N products
+    
+    Products without demand get no order and max_days of coverage.
+    """
+    has_demand = daily_demands >= 0.001
+    
+    days_remaining = np.full(current_stocks.shape, float(max_days))
+    np.divide(current_stocks, daily_demands, out=days_remaining, where=has_demand)
+    np.minimum(days_remaining, max_days, out=days_remaining)
+    
+    required = daily_demands * target_days
+    required *= safety_factors
+    required -= current_stocks
+    np.ceil(required, out=required)
+    order_qty = np.where(has_demand, np.maximum(required, 0), 0).astype(np.int64)
+    final_stock = current_stocks + order_qty
+    
+    actual_coverage = np.full(current_stocks.shape, float(max_days))
+    np.divide(final_stock, daily_demands, out=actual_coverage, where=has_demand)
+    
+    return has_demand, days_remaining, order_qty, final_stock, actual_coverage
+
+
+def _to_cents(amount: float) -> int:
+    """Money amount in whole cents, rounding half up"""
+    return _floor(amount * 100 + 0.5)
+
+
+def _from_cents(cents: int) -> float:
+    """Whole cents back to a money amount"""
+    return cents / 100
+
+
+def _to_cents_array(amounts: np.ndarray) -> np.ndarray:
+    """Vectorized _to_cents"""
+    return np.floor(amounts * 100 + 0.5).astype(np.int64)
+
+
+def _supplier_cost_kernel(prices: np.ndarray, order_quantity: int):
+    """
+    Cost comparison across suppliers for one order quantity, in cents
+    
+    Returns (order, cost_cents, savings_cents, max_cents) where order sorts
+    suppliers cheapest first and savings are relative to the most expensive one.
+    """
+    cost_cents = _to_cents_array(prices * order_quantity)
+    order = np.argsort(cost_cents, kind='stable')
+    # Sorted ascending, so the most expensive supplier is the last one
+    max_cents = int(cost_cents[order[-1]])
+    return order, cost_cents, max_cents - cost_cents, max_cents
+
+
+class ScenarioBatch:
+    """
+    Coverage scenarios for one product, one NumPy column per field
+    
+    Dicts are only built by to_dicts() at the API boundary.
+    """
+    
+    __slots__ = (
+        'periods', 'labels', 'periods_arr', 'order_qty', 'final_stock', 'actual_coverage',
+        'includes_safety_stock', 'safety_factor', 'days_remaining',
+        'unit_price', 'total_cost', 'cost_per_day'
+    )
+    
+    def __init__(
+        self,
+        periods: List[int],
+        labels: List[str],
+        periods_arr: np.ndarray,
+        order_qty: np.ndarray,
+        final_stock: np.ndarray,
+        actual_coverage: np.ndarray,
+        includes_safety_stock: bool,
+        safety_factor: float,
+        days_remaining: Optional[float] = None
+    ):
+        self.periods = periods
+        self.labels = labels
+        self.periods_arr = periods_arr
+        self.order_qty = order_qty
+        self.final_stock = final_stock
+        self.actual_coverage = actual_coverage
+        self.includes_safety_stock = includes_safety_stock
+        self.safety_factor = safety_factor
+        # Coverage of the current stock alone; None when there is no demand
+        self.days_remaining = days_remaining
+        self.unit_price: Optional[float] = None
+        self.total_cost: Optional[np.ndarray] = None
+        self.cost_per_day: Optional[np.ndarray] = None
+    
+    def apply_pricing(self, unit_price: float) -> 'ScenarioBatch':
+        """Add total cost and cost per day columns (zero-day periods cost nothing per day)"""
+        total_cost = self.order_qty * unit_price
+        cost_per_day = np.divide(
+            total_cost, self.periods_arr, out=np.zeros(len(self.periods)), where=self.periods_arr > 0
+        )
+        self.unit_price = unit_price
+        self.total_cost = _to_cents_array(total_cost) / 100
+        self.cost_per_day = _to_cents_array(cost_per_day) / 100
+        return self
+    
+    def to_dicts(self) -> List[Dict]:
+        """Materialize the legacy list-of-dicts representation"""
+        scenarios = [
+            {
+                'label': label,
+                'coverage_days': days,
+                'order_quantity': order_qty,
+                'final_stock': final_stock,
+                'actual_coverage': round(actual, 2),
+                'includes_safety_stock': self.includes_safety_stock,
+                'safety_factor': self.safety_factor
+            }
+            for label, days, order_qty, final_stock, actual in zip(
+                self.labels,
+                self.periods,
+                self.order_qty.tolist(),
+                self.final_stock.tolist(),
+                self.actual_coverage.tolist()
+            )
+        ]
+        
+        if self.total_cost is not None:
+            for scenario, total_cost, cost_per_day in zip(
+                scenarios, self.total_cost.tolist(), self.cost_per_day.tolist()
+            ):
+                scenario['unit_price'] = self.unit_price
+                scenario['total_cost'] = total_cost
+                scenario['cost_per_day'] = cost_per_day
+        
+        return scenarios
 
 
 class CoverageCalculator:
@@ -19,32 +252,77 @@ class CoverageCalculator:
     # Maximum days we care about (prevent datetime overflow)
     MAX_COVERAGE_DAYS = 365  # 1 year maximum
     
+    # Human-readable labels for common periods
+    _LABELS = {
+        1: "1 Day",
+        7: "1 Week",
+        14: "2 Weeks",
+        30: "1 Month",
+        60: "2 Months",
+        90: "3 Months"
+    }
+    
     def __init__(self):
         self.standard_periods = [1, 7, 14, 30, 60, 90]  # Days
+        self._periods_arr = np.asarray(self.standard_periods, dtype=np.float64)
+        self._standard_labels = [self._period_label(d) for d in self.standard_periods]
+        # timedeltas are immutable, so whole-day offsets can be shared across calls
+        self._period_timedeltas = {d: timedelta(days=d) for d in self.standard_periods}
+        # Order math specialized per safety-stock setting, picked once per call
+        self._order_calcs = {True: _order_with_safety, False: _order_plain}
     
-    def _safe_future_date(self, days: float) -> Optional[str]:
+    def _safe_future_date(self, days: float, now: Optional[datetime] = None) -> Optional[str]:
         """
         Safely calculate future date, capping at max Python datetime
         Returns None if date would be too far in future
+        
+        Pass `now` to reuse one timestamp across a request instead of reading the clock per call.
         """
-        if days >= self.MAX_COVERAGE_DAYS:
+        # Negated so NaN also returns None
+        if not (days < self.MAX_COVERAGE_DAYS):
             return None
         
+        if now is None:
+            now = datetime.now()
+        
         try:
-            future_date = datetime.now() + timedelta(days=days)
-            return future_date.isoformat()
+            # 7.0 hashes like 7, so whole-day floats hit the cache too
+            td = self._period_timedeltas.get(days) or timedelta(days=days)
+            return (now + td).isoformat()
         except (OverflowError, ValueError):
+            # Large negative days (e.g. deeply negative stock) go below datetime.min
             return None
     
     def calculate_current_coverage(
         self,
         current_stock: float,
-        daily_demand: float
+        daily_demand: float,
+        now: Optional[datetime] = None
     ) -> Dict:
         """
         Calculate how long current stock will last
         """
-        if daily_demand <= 0 or daily_demand < 0.001:
+        # Single compare; also treats NaN demand as no demand
+        if not (daily_demand >= 0.001):
+            return self._coverage_from_days(current_stock, daily_demand, None, now)
+        
+        # Capped to prevent datetime overflow
+        days_remaining = _days_remaining(current_stock, daily_demand, self.MAX_COVERAGE_DAYS)
+        return self._coverage_from_days(current_stock, daily_demand, days_remaining, now)
+    
+    def _coverage_from_days(
+        self,
+        current_stock: float,
+        daily_demand: float,
+        days_remaining: Optional[float],
+        now: Optional[datetime] = None
+    ) -> Dict:
+        """
+        Coverage result for an already computed (capped) days_remaining
+        
+        days_remaining is None when there is no demand.
+        """
+        if days_remaining is None:
             return {
                 'current_stock': current_stock,
                 'daily_demand': daily_demand,
@@ -54,29 +332,12 @@ class CoverageCalculator:
                 'message': 'No demand detected - stock will last indefinitely'
             }
         
-        days_remaining = current_stock / daily_demand
-        
-        # Cap days_remaining to prevent datetime overflow
-        days_remaining = min(days_remaining, self.MAX_COVERAGE_DAYS)
-        
         # Safe date calculation
-        stockout_date = self._safe_future_date(days_remaining)
-        
-        if days_remaining < 1:
-            status = 'CRITICAL'
-            message = f'CRITICAL: Stock will run out in {days_remaining:.1f} days'
-        elif days_remaining < 3:
-            status = 'URGENT'
-            message = f'URGENT: Only {days_remaining:.1f} days of stock remaining'
-        elif days_remaining < 7:
-            status = 'LOW'
-            message = f'LOW: {days_remaining:.1f} days of stock remaining'
-        elif days_remaining < 30:
-            status = 'GOOD'
-            message = f'GOOD: {days_remaining:.1f} days of stock remaining'
-        else:
-            status = 'OVERSTOCKED'
-            message = f'OVERSTOCKED: {days_remaining:.1f} days of stock remaining'
+        stockout_date = self._safe_future_date(days_remaining, now)
+        
+        status_idx = _status_index(days_remaining)
+        status = _STATUSES[status_idx]
+        message = _STATUS_MESSAGES[status_idx] % f'{days_remaining:.1f}'
         
         return {
             'current_stock': current_stock,
@@ -87,6 +348,26 @@ class CoverageCalculator:
             'message': message
         }
     
+    def _order_quantity_tuple(
+        self,
+        current_stock: float,
+        daily_demand: float,
+        target_coverage_days: int,
+        include_safety_stock: bool = True,
+        safety_factor: float = 1.2
+    ) -> Tuple[int, float, float]:
+        """
+        Order quantity math without building a result dict
+        
+        Returns (order_quantity, final_stock, actual_coverage_days)
+        """
+        if not (daily_demand >= 0.001):
+            return 0, current_stock, self.MAX_COVERAGE_DAYS
+        
+        return self._order_calcs[bool(include_safety_stock)](
+            current_stock, daily_demand, target_coverage_days, safety_factor
+        )
+    
     def calculate_order_quantity(
         self,
         current_stock: float,
@@ -98,7 +379,7 @@ class CoverageCalculator:
         """
         Calculate order quantity needed for target coverage
         """
-        if daily_demand <= 0 or daily_demand < 0.001:
+        if not (daily_demand >= 0.001):
             return {
                 'order_quantity': 0,
                 'target_coverage_days': target_coverage_days,
@@ -111,76 +392,123 @@ class CoverageCalculator:
                 'message': 'No demand - no order needed'
             }
         
-        # Calculate base requirement
-        required_stock = daily_demand * target_coverage_days
-        
-        # Apply safety factor if requested
-        if include_safety_stock:
-            required_stock *= safety_factor
-        
-        # Calculate order quantity (never negative)
-        order_quantity = max(0, math.ceil(required_stock - current_stock))
-        
-        # Calculate actual coverage after order
-        final_stock = current_stock + order_quantity
-        actual_coverage = final_stock / daily_demand
+        order_quantity, final_stock, actual_coverage = self._order_calcs[bool(include_safety_stock)](
+            current_stock, daily_demand, target_coverage_days, safety_factor
+        )
         
         return {
             'order_quantity': order_quantity,
             'target_coverage_days': target_coverage_days,
             'current_stock': current_stock,
             'final_stock': final_stock,
-            'actual_coverage_days': round(actual_coverage, 2),
+            'actual_coverage_days': actual_coverage,
             'includes_safety_stock': include_safety_stock,
             'safety_factor': safety_factor if include_safety_stock else 1.0,
             'daily_demand': daily_demand
         }
     
-    def generate_scenarios(
+    def calculate_bulk(
+        self,
+        current_stocks: np.ndarray,
+        daily_demands: np.ndarray,
+        target_days: Union[int, np.ndarray] = 30,
+        safety_factor: Union[float, np.ndarray] = 1.2
+    ) -> np.ndarray:
+        """
+        Coverage and order quantity for a whole catalog in one vectorized pass
+        
+        Takes N stocks and N demands (target_days and safety_factor may be
+        scalars or length-N arrays) and returns a structured array with one
+        _BULK_DTYPE row per product. Status is the current coverage status,
+        NO_DEMAND when demand is below 0.001. Coverage days are not rounded.
+        """
+        current_stocks, daily_demands, target_days, safety_factor = np.broadcast_arrays(
+            np.asarray(current_stocks, dtype=np.float64),
+            np.asarray(daily_demands, dtype=np.float64),
+            np.asarray(target_days, dtype=np.float64),
+            np.asarray(safety_factor, dtype=np.float64)
+        )
+        
+        has_demand, days_remaining, order_qty, final_stock, actual_coverage = _bulk_kernel(
+            current_stocks, daily_demands, target_days, safety_factor, self.MAX_COVERAGE_DAYS
+        )
+        status_idx = np.where(has_demand, _status_indices(days_remaining), len(_STATUSES))
+        
+        result = np.empty(current_stocks.shape, dtype=_BULK_DTYPE)
+        result['current_stock'] = current_stocks
+        result['daily_demand'] = daily_demands
+        result['days_remaining'] = days_remaining
+        result['status'] = _BULK_STATUSES[status_idx]
+        result['order_quantity'] = order_qty
+        result['final_stock'] = final_stock
+        result['actual_coverage_days'] = actual_coverage
+        return result
+    
+    def _generate_scenarios_arrays(
         self,
         current_stock: float,
         daily_demand: float,
         custom_periods: Optional[List[int]] = None,
         include_safety_stock: bool = True,
         safety_factor: float = 1.2
+    ) -> ScenarioBatch:
+        """
+        Scenario math for all periods as NumPy arrays
+        """
+        if custom_periods:
+            periods = custom_periods
+            periods_arr = np.asarray(custom_periods, dtype=np.float64)
+            labels = [self._period_label(d) for d in custom_periods]
+        else:
+            periods = self.standard_periods
+            periods_arr = self._periods_arr
+            labels = self._standard_labels
+        
+        factor = safety_factor if include_safety_stock else 1.0
+        
+        if not (daily_demand >= 0.001):
+            # No demand - nothing to order for any period
+            order_arr = np.zeros(len(periods), dtype=np.int64)
+            final_arr = current_stock + order_arr
+            actual_arr = np.full(len(periods), self.MAX_COVERAGE_DAYS)
+            days_remaining = None
+        else:
+            order_arr, final_arr, actual_arr = _scenario_kernel(
+                current_stock, daily_demand, periods_arr, factor
+            )
+            days_remaining = _days_remaining(current_stock, daily_demand, self.MAX_COVERAGE_DAYS)
+        
+        return ScenarioBatch(
+            periods, labels, periods_arr, order_arr, final_arr, actual_arr,
+            include_safety_stock, factor, days_remaining
+        )
+    
+    def generate_scenarios(
+        self,
+        current_stock: float,
+        daily_demand: float,
+        custom_periods: Optional[List[int]] = None,
+        include_safety_stock: bool = True,
+        safety_factor: float = 1.2,
+        now: Optional[datetime] = None
     ) -> Dict:
         """
         Generate multiple coverage scenarios
         
         Returns scenarios for 1 day, 1 week, 2 weeks, 1 month, etc.
         """
-        periods = custom_periods if custom_periods else self.standard_periods
-        
-        scenarios = []
-        
-        for days in periods:
-            calc = self.calculate_order_quantity(
-                current_stock,
-                daily_demand,
-                days,
-                include_safety_stock,
-                safety_factor
-            )
-            
-            # Calculate cost estimate (per unit price to be provided by caller)
-            scenarios.append({
-                'label': self._period_label(days),
-                'coverage_days': days,
-                'order_quantity': calc['order_quantity'],
-                'final_stock': calc['final_stock'],
-                'actual_coverage': calc['actual_coverage_days'],
-                'includes_safety_stock': include_safety_stock,
-                'safety_factor': calc['safety_factor']
-            })
+        batch = self._generate_scenarios_arrays(
+            current_stock, daily_demand, custom_periods, include_safety_stock, safety_factor
+        )
         
-        # Current coverage
-        current_coverage = self.calculate_current_coverage(current_stock, daily_demand)
+        # Current coverage, reusing the demand check and days remaining from the batch
+        current_coverage = self._coverage_from_days(current_stock, daily_demand, batch.days_remaining, now)
         
         return {
             'current_coverage': current_coverage,
-            'scenarios': scenarios,
+            'scenarios': batch.to_dicts(),
             'daily_demand': daily_demand,
-            'safety_factor': safety_factor if include_safety_stock else 1.0
+            'safety_factor': batch.safety_factor
         }
     
     def recommend_scenario(
@@ -221,7 +549,7 @@ class CoverageCalculator:
             reason = "Standard coverage recommendation"
         
         # Generate scenario for recommended period
-        calc = self.calculate_order_quantity(
+        order_quantity, final_stock, actual_coverage = self._order_quantity_tuple(
             current_stock,
             daily_demand,
             recommended_days,
@@ -230,9 +558,9 @@ class CoverageCalculator:
         
         return {
             'recommended_coverage_days': recommended_days,
-            'order_quantity': calc['order_quantity'],
-            'final_stock': calc['final_stock'],
-            'actual_coverage': calc['actual_coverage_days'],
+            'order_quantity': order_quantity,
+            'final_stock': final_stock,
+            'actual_coverage': actual_coverage,
             'demand_pattern': demand_pattern,
             'reason': reason,
             'lead_time_days': lead_time_days
@@ -243,25 +571,22 @@ class CoverageCalculator:
         current_stock: float,
         daily_demand: float,
         unit_price: float,
-        custom_periods: Optional[List[int]] = None
+        custom_periods: Optional[List[int]] = None,
+        now: Optional[datetime] = None
     ) -> Dict:
         """
         Generate scenarios with cost calculations
         """
-        scenarios_result = self.generate_scenarios(current_stock, daily_demand, custom_periods)
-        
-        # Add pricing to each scenario
-        for scenario in scenarios_result['scenarios']:
-            total_cost = scenario['order_quantity'] * unit_price
-            cost_per_day = total_cost / scenario['coverage_days'] if scenario['coverage_days'] > 0 else 0
-            
-            scenario['unit_price'] = unit_price
-            scenario['total_cost'] = round(total_cost, 2)
-            scenario['cost_per_day'] = round(cost_per_day, 2)
-        
-        scenarios_result['unit_price'] = unit_price
+        batch = self._generate_scenarios_arrays(current_stock, daily_demand, custom_periods)
+        batch.apply_pricing(unit_price)
         
-        return scenarios_result
+        return {
+            'current_coverage': self._coverage_from_days(current_stock, daily_demand, batch.days_remaining, now),
+            'scenarios': batch.to_dicts(),
+            'daily_demand': daily_demand,
+            'safety_factor': batch.safety_factor,
+            'unit_price': unit_price
+        }
     
     def compare_suppliers_coverage(
         self,
@@ -273,53 +598,82 @@ class CoverageCalculator:
         """
         Compare cost for same coverage across multiple suppliers
         """
-        calc = self.calculate_order_quantity(current_stock, daily_demand, coverage_days)
-        order_quantity = calc['order_quantity']
+        order_quantity, final_stock, _ = self._order_quantity_tuple(current_stock, daily_demand, coverage_days)
+        
+        if not supplier_prices:
+            return []
+        
+        if order_quantity == 0:
+            # Nothing to buy: every supplier costs 0, so skip the sort and savings math
+            return [
+                {
+                    'supplier_id': supplier_id,
+                    'unit_price': price,
+                    'order_quantity': 0,
+                    'total_cost': 0.0,
+                    'coverage_days': coverage_days,
+                    'final_stock': final_stock,
+                    'savings': 0.0,
+                    'savings_percent': 0,
+                    'is_cheapest': rank == 0
+                }
+                for rank, (supplier_id, price) in enumerate(supplier_prices.items())
+            ]
+        
+        supplier_ids = list(supplier_prices.keys())
+        prices = list(supplier_prices.values())
+        order, cost_cents, savings_cents, max_cents = _supplier_cost_kernel(
+            np.fromiter(prices, dtype=np.float64, count=len(prices)),
+            order_quantity
+        )
         
-        comparisons = []
+        # Add savings vs most expensive
+        if max_cents > 0:
+            savings_percent = np.round(savings_cents / max_cents * 100, 1).tolist()
+        else:
+            savings_percent = [0] * len(prices)
+        
+        costs = (cost_cents / 100).tolist()
+        savings = (savings_cents / 100).tolist()
         
-        for supplier_id, price in supplier_prices.items():
-            total_cost = order_quantity * price
-            
-            comparisons.append({
-                'supplier_id': supplier_id,
-                'unit_price': price,
+        # Emit comparisons sorted by cost
+        return [
+            {
+                'supplier_id': supplier_ids[i],
+                'unit_price': prices[i],
                 'order_quantity': order_quantity,
-                'total_cost': round(total_cost, 2),
+                'total_cost': costs[i],
                 'coverage_days': coverage_days,
-                'final_stock': calc['final_stock']
-            })
-        
-        # Sort by cost
-        comparisons.sort(key=lambda x: x['total_cost'])
-        
-        # Add savings vs most expensive
-        if comparisons:
-            max_cost = max(c['total_cost'] for c in comparisons)
-            for comp in comparisons:
-                comp['savings'] = round(max_cost - comp['total_cost'], 2)
-                comp['savings_percent'] = round((comp['savings'] / max_cost * 100), 1) if max_cost > 0 else 0
-                comp['is_cheapest'] = comp['total_cost'] == comparisons[0]['total_cost']
-        
-        return comparisons
+                'final_stock': final_stock,
+                'savings': savings[i],
+                'savings_percent': savings_percent[i],
+                'is_cheapest': rank == 0
+            }
+            for rank, i in enumerate(order.tolist())
+        ]
     
-    @staticmethod
-    def _period_label(days: int) -> str:
+    @classmethod
+    def _period_label(cls, days: int) -> str:
         """Convert days to human-readable label"""
-        if days == 1:
-            return "1 Day"
-        elif days == 7:
-            return "1 Week"
-        elif days == 14:
-            return "2 Weeks"
-        elif days == 30:
-            return "1 Month"
-        elif days == 60:
-            return "2 Months"
-        elif days == 90:
-            return "3 Months"
-        else:
-            return f"{days} Days"
+        return cls._LABELS.get(days) or f"{days} Days"
+
+
+class DiscountTiers:
+    """Volume discount tiers, sorted once for repeated lookups"""
+    
+    __slots__ = ('tiers', 'min_qtys')
+    
+    def __init__(self, tiers: List[Dict]):
+        # Stable sort keeps the first-listed tier when two share a min_qty
+        self.tiers = sorted(tiers, key=lambda x: x['min_qty'])
+        self.min_qtys = [tier['min_qty'] for tier in self.tiers]
+    
+    def find(self, order_quantity: int) -> Optional[Dict]:
+        """Highest tier whose min_qty the order quantity reaches, or None"""
+        idx = bisect_right(self.min_qtys, order_quantity) - 1
+        if idx < 0:
+            return None
+        return self.tiers[bisect_left(self.min_qtys, self.min_qtys[idx])]
 
 
 class BulkOrderCalculator:
@@ -343,8 +697,8 @@ class BulkOrderCalculator:
             adjusted_quantity = moq
             reason = f"Increased to meet MOQ of {moq}"
         elif moq_increment > 1:
-            # Round up to nearest increment
-            adjusted_quantity = math.ceil(order_quantity / moq_increment) * moq_increment
+            # Round up to nearest increment (ceiling via floor division, no float division)
+            adjusted_quantity = int(-(-order_quantity // moq_increment)) * moq_increment
             reason = f"Rounded to nearest increment of {moq_increment}"
         else:
             adjusted_quantity = order_quantity
@@ -363,22 +717,20 @@ class BulkOrderCalculator:
     def calculate_volume_discount(
         order_quantity: int,
         base_price: float,
-        discount_tiers: List[Dict]  # [{'min_qty': 100, 'discount_percent': 10}]
+        discount_tiers: Union[List[Dict], DiscountTiers]  # [{'min_qty': 100, 'discount_percent': 10}]
     ) -> Dict:
         """
         Calculate price with volume discounts
         
-        discount_tiers should be sorted by min_qty (ascending)
+        Tiers may be given in any order; pass a DiscountTiers built once from a
+        supplier catalog to skip sorting on every call.
         """
-        # Find applicable discount tier
-        applicable_discount = 0
-        applicable_tier = None
+        if not isinstance(discount_tiers, DiscountTiers):
+            discount_tiers = DiscountTiers(discount_tiers)
         
-        for tier in sorted(discount_tiers, key=lambda x: x['min_qty'], reverse=True):
-            if order_quantity >= tier['min_qty']:
-                applicable_discount = tier['discount_percent']
-                applicable_tier = tier
-                break
+        # Find applicable discount tier
+        applicable_tier = discount_tiers.find(order_quantity)
+        applicable_discount = applicable_tier['discount_percent'] if applicable_tier else 0
         
         # Calculate discounted price
         discount_amount = base_price * (applicable_discount / 100)
@@ -390,10 +742,10 @@ class BulkOrderCalculator:
             'order_quantity': order_quantity,
             'base_price': base_price,
             'discount_percent': applicable_discount,
-            'discount_amount': round(discount_amount, 2),
-            'final_price': round(final_price, 2),
-            'total_cost': round(total_cost, 2),
-            'total_savings': round(total_savings, 2),
+            'discount_amount': _from_cents(_to_cents(discount_amount)),
+            'final_price': _from_cents(_to_cents(final_price)),
+            'total_cost': _from_cents(_to_cents(total_cost)),
+            'total_savings': _from_cents(_to_cents(total_savings)),
             'tier': applicable_tier
         }
 
@@ -1,12 +1,22 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from typing import List, Dict, Optional, Any, Tuple, Callable, Awaitable, Iterator
+from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
 import httpx
 from math import sqrt
+from bisect import bisect_right
+import numpy as np
 from pathlib import Path
+from types import MappingProxyType
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import time
+import traceback
+import orjson
 
 # Load .env from the forecast service directory (not root)
 env_path = Path(__file__).parent / '.env'
@@ -15,9 +25,29 @@ load_dotenv(dotenv_path=env_path, override=True)
 app = FastAPI(
     title="Pharmacy Forecast Service",
     description="Demand forecasting and replenishment recommendations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Streamed responses that must reach the client line by line; gzip would
+# buffer them until zlib has a full block or the stream ends
+UNCOMPRESSED_PATHS = frozenset({"/v3/daily-action-list/stream"})
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes UNCOMPRESSED_PATHS through untouched"""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress larger JSON bodies (recommendations grow with SKUs x scenarios)
+# for clients that send Accept-Encoding: gzip
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Force correct API_CORE_URL (override any parent .env)
 API_CORE_URL = os.getenv("API_CORE_URL", "http://localhost:14000")
 if "3000" in API_CORE_URL or "4000" in API_CORE_URL:
@@ -81,35 +111,135 @@ class SimulateResponse(BaseModel):
     estimatedStockout: bool
 
 
+# Shared api-core client so calls reuse pooled keep-alive connections.
+# Opened on startup and closed on shutdown; get_http_client() also opens it lazily.
+http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared api-core client, creating it on first use"""
+    global http_client
+    if http_client is None or http_client.is_closed:
+        http_client = httpx.AsyncClient(
+            base_url=API_CORE_URL,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        )
+    return http_client
+
+
+# Short-lived cache of api-core snapshots: sales history per (storeId, sku, days),
+# stock per (storeId, sku) and the whole inventory map per storeId. Dashboards
+# poll the same store repeatedly and this data rarely changes within a couple
+# of minutes. Only successful responses are cached, never the fallback data.
+CACHE_TTL_SECONDS = float(os.getenv("FORECAST_CACHE_TTL", "120"))
+CACHE_MAX_ENTRIES = 50000
+_snapshot_cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+
+def cache_get(key: Tuple) -> Optional[Any]:
+    """Cached value for key, or None if missing or expired"""
+    entry = _snapshot_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _snapshot_cache.pop(key, None)
+        return None
+    return value
+
+
+def cache_put(key: Tuple, value: Any, ttl: Optional[float] = None) -> None:
+    """Store value for ttl seconds, CACHE_TTL_SECONDS by default (no-op when the TTL is 0)"""
+    if ttl is None:
+        ttl = CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    if len(_snapshot_cache) >= CACHE_MAX_ENTRIES:
+        # Drop expired entries first; if still full, start over
+        for stale in [k for k, (expires_at, _) in _snapshot_cache.items() if expires_at < now]:
+            del _snapshot_cache[stale]
+        if len(_snapshot_cache) >= CACHE_MAX_ENTRIES:
+            _snapshot_cache.clear()
+    _snapshot_cache[key] = (now + ttl, value)
+
+
+# api-core calls currently in flight, by key (see single_flight)
+_inflight: Dict[Tuple, asyncio.Future] = {}
+
+
+async def single_flight(key: Tuple, make_call: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Await make_call() once for all concurrent callers with the same key
+
+    Callers arriving while the call is in flight (e.g. on a cold cache) share
+    its result instead of repeating it. The call is shielded, so one caller
+    being cancelled doesn't cancel it for the others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(make_call())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
 # Helper functions
 async def fetch_sales_history(store_id: str, skus: List[str], days: int = 30) -> Dict[str, List[float]]:
     """Fetch sales history from api-core with custom period"""
+    # Serve SKUs from the cache and only ask api-core for the rest
+    history = {}
+    missing = []
+    for sku in skus:
+        cached = cache_get(("history", store_id, sku, days))
+        if cached is None:
+            missing.append(sku)
+        else:
+            history[sku] = cached
+    if not missing:
+        return history
+
+    # Concurrent requests missing the same SKUs share one api-core call
+    history.update(await single_flight(
+        ("history", store_id, frozenset(missing), days),
+        lambda: request_sales_history(store_id, missing, days)
+    ))
+    return history
+
+
+async def request_sales_history(store_id: str, skus: List[str], days: int) -> Dict[str, List[float]]:
+    """POST /sales/history for skus and cache each SKU's history (mock data if the call fails)"""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    f"{API_CORE_URL}/sales/history",
-                    json={
-                        "storeId": store_id,
-                        "skus": skus,
-                        "days": days
-                    },
-                    timeout=30.0
-                )
+        client = get_http_client()
+        try:
+            response = await client.post(
+                "/sales/history",
+                content=orjson.dumps({
+                    "storeId": store_id,
+                    "skus": skus,
+                    "days": days
+                }),
+                headers={"Content-Type": "application/json"},
+                timeout=30.0
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("history", {})
-                else:
-                    print(f"Failed to fetch sales history: {response.status_code}")
-                    print(f"Response: {response.text[:200]}")
-                    # Fallback to mock data if API fails
-                    return {sku: [10, 12, 8, 15, 11, 9, 13] * 4 for sku in skus}
-            except httpx.ConnectError as e:
-                print(f"Connection error to API Core: {e}")
-                print(f"Is API Core running on {API_CORE_URL}?")
-                print(f"Attempted URL: {API_CORE_URL}/sales/history")
-                raise
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                fetched = data.get("history", {})
+                for sku, values in fetched.items():
+                    cache_put(("history", store_id, sku, days), values)
+                return fetched
+            else:
+                print(f"Failed to fetch sales history: {response.status_code}")
+                print(f"Response: {response.text[:200]}")
+                # Fallback to mock data if API fails
+                return {sku: [10, 12, 8, 15, 11, 9, 13] * 4 for sku in skus}
+        except httpx.ConnectError as e:
+            print(f"Connection error to API Core: {e}")
+            print(f"Is API Core running on {API_CORE_URL}?")
+            print(f"Attempted URL: {API_CORE_URL}/sales/history")
+            raise
 
     except Exception as e:
         print(f"Error fetching sales history: {e}")
@@ -121,10 +251,26 @@ async def fetch_sales_history(store_id: str, skus: List[str], days: int = 30) ->
         return {sku: [10, 12, 8, 15, 11, 9, 13] * 4 for sku in skus}
 
 
+async def fetch_sales_history_one(store_id: str, sku: str, days: int = 30) -> List[float]:
+    """
+    Sales history for a single SKU
+
+    api-core only exposes the multi-SKU /sales/history, so this goes through
+    fetch_sales_history and is answered from its per-SKU cache when a recent
+    request already fetched this SKU.
+    """
+    return (await fetch_sales_history(store_id, [sku], days)).get(sku, [])
+
+
+# Day names to datetime.weekday() numbers (Monday == 0)
+_WEEKDAY_NUMBERS = MappingProxyType({
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+})
+
+
 def calculate_next_delivery_date(schedule: Dict[str, Any]) -> datetime:
     """Calculate next delivery date based on supplier schedule"""
-    from datetime import timedelta
-
     today = datetime.now()
     schedule_type = schedule.get('type')
 
@@ -134,33 +280,25 @@ def calculate_next_delivery_date(schedule: Dict[str, Any]) -> datetime:
 
     elif schedule_type == 'specific_days':
         days = schedule.get('days', [])
-        day_map = {
-            'sunday': 0, 'monday': 1, 'tuesday': 2, 'wednesday': 3,
-            'thursday': 4, 'friday': 5, 'saturday': 6
-        }
-
-        # Find next occurrence of any of these days
-        for i in range(1, 8):
-            next_date = today + timedelta(days=i)
-            day_name = next_date.strftime('%A').lower()
-            if day_name in days:
-                return next_date
-        return today + timedelta(days=7)  # Fallback
+        mask = 0
+        for day in days:
+            if day in _WEEKDAY_NUMBERS:
+                mask |= 1 << _WEEKDAY_NUMBERS[day]
+        if not mask:
+            return today + timedelta(days=7)  # Fallback
+
+        # Rotate the 7-bit weekday mask so bit k means "k + 1 days from today";
+        # the lowest set bit is then the next occurrence of any of these days
+        shift = (today.weekday() + 1) % 7
+        ahead = ((mask >> shift) | (mask << (7 - shift))) & 0x7F
+        return today + timedelta(days=(ahead & -ahead).bit_length())
 
     elif schedule_type == 'weekly':
         target_day = schedule.get('day', 'monday')
-        day_map = {
-            'sunday': 0, 'monday': 1, 'tuesday': 2, 'wednesday': 3,
-            'thursday': 4, 'friday': 5, 'saturday': 6
-        }
-        target_day_num = day_map.get(target_day, 1)
+        target_day_num = _WEEKDAY_NUMBERS.get(target_day, 0)
 
-        # Find next occurrence of this day
-        for i in range(1, 8):
-            next_date = today + timedelta(days=i)
-            if next_date.weekday() == target_day_num:
-                return next_date
-        return today + timedelta(days=7)
+        # Next occurrence of this day, 1-7 days ahead
+        return today + timedelta(days=(target_day_num - today.weekday() - 1) % 7 + 1)
 
     elif schedule_type == 'bi_weekly':
         # Simplified bi-weekly (every 14 days)
@@ -171,46 +309,158 @@ def calculate_next_delivery_date(schedule: Dict[str, Any]) -> datetime:
         return today + timedelta(days=7)
 
 
-async def fetch_current_stock(store_id: str, sku: str) -> int:
-    """Fetch current stock level for a product from api-core"""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_CORE_URL}/batches/inventory-summary",
-                params={"storeId": store_id},
-                timeout=10.0
-            )
+# Stock assumed for every SKU when the inventory summary can't be fetched
+FALLBACK_STOCK = 50
+# Longest comma-joined SKU list sent as the inventory summary's skus filter;
+# it may grow up to 3x once URL-encoded
+INVENTORY_FILTER_MAX_CHARS = 2048
+# Shared default for rows without a product, instead of a new {} per row
+_NO_PRODUCT = MappingProxyType({})
 
-            if response.status_code == 200:
-                data = response.json()
-                inventory = data.get("inventory", [])
 
-                # Find the product by SKU
-                for item in inventory:
-                    if item.get("product", {}).get("sku") == sku:
-                        return item.get("totalQty", 0)
+async def fetch_inventory_map(store_id: str, skus: Optional[List[str]] = None) -> Optional[Dict[str, int]]:
+    """
+    Fetch the store's inventory summary from api-core once as {sku: totalQty}
+
+    With skus, only those SKUs are requested (api-core filters server-side)
+    and cached one by one; the map then covers exactly those SKUs, with 0 for
+    ones not in stock. Returns None if the request fails, so callers can
+    apply FALLBACK_STOCK.
+    """
+    if skus is None:
+        cached = cache_get(("inventory", store_id))
+        if cached is not None:
+            return cached
+        return await single_flight(
+            ("inventory", store_id, None),
+            lambda: request_inventory_summary(store_id)
+        )
 
-                # Product not found, return 0
-                return 0
+    inventory_map = {}
+    missing = []
+    for sku in skus:
+        cached = cache_get(("stock", store_id, sku))
+        if cached is None:
+            missing.append(sku)
+        else:
+            inventory_map[sku] = cached
+    if not missing:
+        return inventory_map
+
+    # A long SKU list would push the query string past api-core's URL/header
+    # limits (Node allows 16 KB); read those SKUs from the full summary instead
+    if sum(len(sku) + 1 for sku in missing) > INVENTORY_FILTER_MAX_CHARS:
+        full_map = await fetch_inventory_map(store_id)
+        if full_map is None:
+            return None
+        for sku in missing:
+            inventory_map[sku] = full_map.get(sku, 0)
+        return inventory_map
+
+    # Concurrent requests missing the same SKUs share one api-core call
+    fetched = await single_flight(
+        ("inventory", store_id, frozenset(missing)),
+        lambda: request_inventory_summary(store_id, missing)
+    )
+    if fetched is None:
+        return None
+    for sku in missing:
+        inventory_map[sku] = fetched.get(sku, 0)
+    return inventory_map
+
+
+async def request_inventory_summary(store_id: str, skus: Optional[List[str]] = None) -> Optional[Dict[str, int]]:
+    """
+    GET /batches/inventory-summary (all SKUs, or only skus) as {sku: totalQty}
+
+    Caches the whole map, or each requested SKU's stock (0 if not stocked).
+    Returns None if the request fails.
+    """
+    params = {"storeId": store_id}
+    if skus is not None:
+        params["skus"] = ",".join(skus)
+
+    try:
+        response = await get_http_client().get(
+            "/batches/inventory-summary",
+            params=params,
+            timeout=10.0
+        )
+
+        if response.status_code == 200:
+            items = orjson.loads(response.content).get("inventory", [])
+            # One pass over the parsed rows; walking them in reverse lets the
+            # first entry per SKU win, as the old linear scan did
+            inventory_map = {
+                item.get("product", _NO_PRODUCT).get("sku"): item.get("totalQty", 0)
+                for item in reversed(items)
+            }
+            if skus is None:
+                cache_put(("inventory", store_id), inventory_map)
             else:
-                print(f"Failed to fetch inventory: {response.status_code}")
-                return 50  # Fallback value
+                for sku in skus:
+                    cache_put(("stock", store_id, sku), inventory_map.get(sku, 0))
+            return inventory_map
+        else:
+            print(f"Failed to fetch inventory: {response.status_code}")
+            return None
 
     except Exception as e:
         print(f"Error fetching current stock: {e}")
-        return 50  # Fallback value
+        return None
+
+
+def lookup_current_stock(inventory_map: Optional[Dict[str, int]], sku: str) -> int:
+    """Current stock for a SKU from fetch_inventory_map's result (0 if not stocked)"""
+    if inventory_map is None:
+        return FALLBACK_STOCK
+    return inventory_map.get(sku, 0)
+
+
+async def fetch_current_stock(store_id: str, sku: str) -> int:
+    """Fetch current stock level for a product from api-core"""
+    return lookup_current_stock(await fetch_inventory_map(store_id, [sku]), sku)
+
+
+# Days-of-stock thresholds (ascending) and the urgency below each one
+_URGENCY_THRESHOLDS = (3, 7, 30)
+_URGENCY_LEVELS = ("CRITICAL", "WARNING", "GOOD", "OVERSTOCKED")
+
+
+# Service level thresholds (ascending) and the z-score from each one upward
+_Z_THRESHOLDS = (0.90, 0.95, 0.99)
+_Z_SCORES = (1.0, 1.28, 1.65, 2.33)
 
 
 def calculate_z_score(service_level: float) -> float:
     """Calculate z-score for given service level"""
-    if service_level >= 0.99:
-        return 2.33
-    elif service_level >= 0.95:
-        return 1.65
-    elif service_level >= 0.90:
-        return 1.28
-    else:
-        return 1.0
+    return _Z_SCORES[bisect_right(_Z_THRESHOLDS, service_level)]
+
+
+def batch_demand_stats(histories: Dict[str, List[float]]) -> Dict[str, Tuple[float, float]]:
+    """
+    Mean and population std dev of daily demand per SKU: {sku: (mean, std_dev)}
+
+    Histories of equal length (the usual case: one analysis period) are
+    stacked into one 2-D array and reduced together; nothing is padded or
+    truncated, so each SKU gets its own exact statistics. Empty histories
+    are skipped.
+    """
+    by_length: Dict[int, List[str]] = {}
+    for sku, history in histories.items():
+        if history:
+            by_length.setdefault(len(history), []).append(sku)
+
+    stats = {}
+    for skus in by_length.values():
+        arr = np.array([histories[sku] for sku in skus], dtype=np.float64)
+        means = arr.mean(axis=1)
+        # Variance from deviations about the mean (never E[x^2] - mean^2),
+        # reusing the means instead of letting np.std recompute them
+        arr -= means[:, None]
+        variances = np.einsum('ij,ij->i', arr, arr) / arr.shape[1]
+        stats.update(zip(skus, zip(means.tolist(), np.sqrt(variances).tolist())))
+    return stats
 
 
 def calculate_safety_stock(std_dev: float, lead_time: int, z_score: float) -> int:
@@ -230,6 +480,184 @@ def calculate_order_qty(mean_demand: float, lead_time: int, moq: int = 1) -> int
     return max(qty, moq)
 
 
+class ReorderBatch:
+    """
+    Reorder parameters for many SKUs, one NumPy column per field
+
+    Columns follow calculate_safety_stock / calculate_rop / calculate_order_qty
+    (same operation order and truncation); response dicts are only built per
+    SKU at the end, from rows().
+    """
+
+    __slots__ = ('skus', 'mean_demand', 'std_dev', 'lead_time', 'safety_stock', 'rop')
+
+    def __init__(
+        self,
+        skus: List[str],
+        stats: Dict[str, Tuple[float, float]],
+        lead_times: Dict[str, int],
+        z_score: float
+    ):
+        self.skus = skus
+        # One lookup per SKU into an (n, 2) array of (mean, std) rows
+        moments = np.array([stats[sku] for sku in skus], dtype=np.float64).reshape(-1, 2)
+        self.mean_demand = moments[:, 0].copy()
+        self.std_dev = moments[:, 1].copy()
+        self.lead_time = np.array([lead_times.get(sku, 7) for sku in skus], dtype=np.int64)  # Default 7 days
+        if (self.lead_time < 0).any():
+            raise ValueError("lead times must be non-negative")
+
+        self.safety_stock = (z_score * self.std_dev * np.sqrt(self.lead_time)).astype(np.int64)
+        self.rop = (self.mean_demand * self.lead_time).astype(np.int64) + self.safety_stock
+
+    def order_qty(self, moq: int = 1) -> np.ndarray:
+        """calculate_order_qty per SKU"""
+        return np.maximum((self.mean_demand * self.lead_time * 2).astype(np.int64), moq)
+
+    def days_remaining(self, current_stock: List[int]) -> np.ndarray:
+        """Days current_stock lasts per SKU (999 where there is no demand)"""
+        return np.divide(
+            np.asarray(current_stock, dtype=np.float64), self.mean_demand,
+            out=np.full(len(self.skus), 999.0),
+            where=self.mean_demand > 0
+        )
+
+    def rows(self) -> Iterator[Tuple[str, float, float, int, int, int]]:
+        """(sku, mean_demand, std_dev, lead_time, safety_stock, rop) per SKU as plain Python values"""
+        return zip(
+            self.skus,
+            self.mean_demand.tolist(),
+            self.std_dev.tolist(),
+            self.lead_time.tolist(),
+            self.safety_stock.tolist(),
+            self.rop.tolist()
+        )
+
+
+def urgency_levels(days_remaining: np.ndarray) -> List[str]:
+    """Urgency level per days-of-stock value (vectorized bisect on _URGENCY_THRESHOLDS)"""
+    indices = np.searchsorted(_URGENCY_THRESHOLDS, days_remaining, side='right')
+    return [_URGENCY_LEVELS[i] for i in indices.tolist()]
+
+
+def build_reorder_suggestion(
+    req: RecommendationRequest,
+    sku: str,
+    mean_demand: float,
+    std_dev: float,
+    z_score: float,
+    current_stock: int,
+    lead_time: int,
+    safety_stock: int,
+    rop: int,
+    order_qty: int
+) -> ReorderSuggestion:
+    """Response entry for one SKU of a /recommendations request"""
+    # Values are computed here and the endpoint's response_model validates
+    # them on the way out, so skip validating on construction as well
+    return ReorderSuggestion.model_construct(
+        sku=sku,
+        currentStock=current_stock,
+        meanDemand=round(mean_demand, 2),
+        stdDevDemand=round(std_dev, 2),
+        rop=rop,
+        orderQty=order_qty,
+        safetyStock=safety_stock,
+        reason={
+            "leadTimeDays": lead_time,
+            "serviceLevel": req.serviceLevel,
+            "zScore": z_score,
+            "shouldReorder": current_stock <= rop
+        }
+    )
+
+
+# Order enough to cover: 1 day, 1 week, 1 month
+COVERAGE_PERIODS = (
+    ("1 Day", 1),
+    ("1 Week", 7),
+    ("1 Month", 30)
+)
+_COVERAGE_DAYS = np.array([days for _, days in COVERAGE_PERIODS], dtype=np.float64)
+
+
+def coverage_scenarios(mean_demands: List[float], current_stocks: List[int]) -> List[List[Dict[str, Any]]]:
+    """
+    Order quantity scenarios for every COVERAGE_PERIODS entry, for many SKUs at once
+
+    Broadcasts demand x coverage days over all SKUs and periods, then builds
+    one scenario list per SKU (in input order).
+    """
+    means = np.asarray(mean_demands, dtype=np.float64)[:, None]
+    stocks = np.asarray(current_stocks, dtype=np.int64)[:, None]
+
+    # Quantity to cover each period (demand truncated to whole units), never negative
+    order_qtys = np.maximum(0, np.floor(means * _COVERAGE_DAYS).astype(np.int64) - stocks)
+    projected_stocks = stocks + order_qtys
+    projected_durations = np.divide(
+        projected_stocks, means,
+        out=np.zeros(order_qtys.shape),
+        where=means > 0
+    )
+
+    return [
+        [
+            {
+                "label": label,
+                "orderQty": order_qty,
+                "projectedStock": projected_stock,
+                "projectedDuration": round(duration, 2) if mean_demand > 0 else 999,
+                "coverageDays": days_coverage
+            }
+            for (label, days_coverage), order_qty, projected_stock, duration
+            in zip(COVERAGE_PERIODS, qty_row, stock_row, duration_row)
+        ]
+        for mean_demand, qty_row, stock_row, duration_row
+        in zip(mean_demands, order_qtys.tolist(), projected_stocks.tolist(), projected_durations.tolist())
+    ]
+
+
+def build_enhanced_suggestion(
+    req: EnhancedRecommendationRequest,
+    sku: str,
+    mean_demand: float,
+    std_dev: float,
+    current_stock: int,
+    lead_time: int,
+    safety_stock: int,
+    rop: int,
+    days_remaining: float,
+    urgency: str,
+    scenarios: List[Dict[str, Any]],
+    next_delivery_date: str
+) -> Dict[str, Any]:
+    """Response entry for one SKU of a /recommendations-v2 request"""
+    # Use 1-week coverage as the recommended quantity
+    recommended_qty = scenarios[1]["orderQty"]
+
+    return {
+        "sku": sku,
+        "currentStock": current_stock,
+        "daysRemaining": round(days_remaining, 2) if mean_demand > 0 else 999,
+        "urgency": urgency,
+        "meanDemand": round(mean_demand, 2),
+        "stdDevDemand": round(std_dev, 2),
+        "rop": rop,
+        "safetyStock": safety_stock,
+        "scenarios": scenarios,
+        "recommendedQty": recommended_qty,
+        "analysisPeriodDays": req.analysisPeriodDays,
+        "nextDeliveryDate": next_delivery_date,
+        "reason": {
+            "leadTimeDays": lead_time,
+            "serviceLevel": req.serviceLevel,
+            "zScore": req.zScore,
+            "shouldReorder": current_stock <= rop,
+            "analysisNote": f"Based on {req.analysisPeriodDays} days of historical data"
+        }
+    }
+
+
 # Endpoints
 @app.get("/health")
 async def health_check():
@@ -249,49 +677,33 @@ async def generate_recommendations(req: RecommendationRequest):
     5. Return recommendations
     """
     try:
-        # Fetch sales history
-        sales_history = await fetch_sales_history(req.storeId, req.skus)
+        # Fetch sales history and the inventory summary (one call for all
+        # SKUs) concurrently; neither depends on the other
+        sales_history, inventory_map = await asyncio.gather(
+            fetch_sales_history(req.storeId, req.skus),
+            fetch_inventory_map(req.storeId, req.skus)
+        )
 
         z_score = calculate_z_score(req.serviceLevel)
-        suggestions = []
-
-        for sku in req.skus:
-            history = sales_history.get(sku, [])
-            if not history:
-                continue
-
-            # Calculate statistics
-            mean_demand = sum(history) / len(history)
-            variance = sum((x - mean_demand) ** 2 for x in history) / len(history)
-            std_dev = sqrt(variance)
-
-            lead_time = req.leadTimes.get(sku, 7)  # Default 7 days
-
-            # Calculate reorder parameters
-            safety_stock = calculate_safety_stock(std_dev, lead_time, z_score)
-            rop = calculate_rop(mean_demand, lead_time, safety_stock)
-            order_qty = calculate_order_qty(mean_demand, lead_time)
-
-            # Fetch current stock from api-core
-            current_stock = await fetch_current_stock(req.storeId, sku)
-
-            suggestions.append(ReorderSuggestion(
-                sku=sku,
-                currentStock=current_stock,
-                meanDemand=round(mean_demand, 2),
-                stdDevDemand=round(std_dev, 2),
-                rop=rop,
-                orderQty=order_qty,
-                safetyStock=safety_stock,
-                reason={
-                    "leadTimeDays": lead_time,
-                    "serviceLevel": req.serviceLevel,
-                    "zScore": z_score,
-                    "shouldReorder": current_stock <= rop
-                }
-            ))
 
-        return RecommendationResponse(
+        # Calculate statistics for every SKU with history in one pass
+        stats = batch_demand_stats({sku: sales_history.get(sku, []) for sku in req.skus})
+
+        # Calculate reorder parameters for all SKUs at once
+        batch = ReorderBatch([sku for sku in req.skus if sku in stats], stats, req.leadTimes, z_score)
+
+        # Current stock comes from the inventory summary fetched above
+        suggestions = [
+            build_reorder_suggestion(
+                req, sku, mean_demand, std_dev, z_score,
+                lookup_current_stock(inventory_map, sku),
+                lead_time, safety_stock, rop, order_qty
+            )
+            for (sku, mean_demand, std_dev, lead_time, safety_stock, rop), order_qty
+            in zip(batch.rows(), batch.order_qty().tolist())
+        ]
+
+        return RecommendationResponse.model_construct(
             suggestions=suggestions,
             generatedAt=datetime.now().isoformat()
         )
@@ -309,13 +721,12 @@ async def simulate_order(req: SimulateRequest):
     """
     try:
         # Fetch sales history
-        sales_history = await fetch_sales_history(req.storeId, [req.sku])
-        history = sales_history.get(req.sku, [])
+        history = await fetch_sales_history_one(req.storeId, req.sku)
 
         if not history:
             raise HTTPException(status_code=404, detail=f"No history found for SKU {req.sku}")
 
-        mean_demand = sum(history) / len(history)
+        mean_demand = float(np.asarray(history, dtype=np.float64).mean())
 
         # Simple simulation: how many days will order_qty last?
         projected_coverage = int(req.orderQty / mean_demand) if mean_demand > 0 else 0
@@ -347,7 +758,6 @@ async def generate_recommendations_v2(req: EnhancedRecommendationRequest):
     - Urgency levels
     """
     try:
-        from datetime import timedelta
 
         # Fetch sales history for custom period
         sales_history = await fetch_sales_history(
@@ -356,94 +766,42 @@ async def generate_recommendations_v2(req: EnhancedRecommendationRequest):
             req.analysisPeriodDays
         )
 
-        suggestions = []
+        # Calculate statistics for every SKU with history in one pass
+        stats = batch_demand_stats({sku: sales_history.get(sku, []) for sku in req.skus})
 
-        for sku in req.skus:
-            history = sales_history.get(sku, [])
-            if not history:
-                continue
+        # Calculate ROP and safety stock for all SKUs at once
+        batch = ReorderBatch([sku for sku in req.skus if sku in stats], stats, req.leadTimes, req.zScore)
 
-            # Calculate statistics
-            mean_demand = sum(history) / len(history) if history else 0
-            variance = sum((x - mean_demand) ** 2 for x in history) / len(history) if history else 0
-            std_dev = sqrt(variance)
+        # Use current stock from request (real inventory data from Node.js)
+        current_stocks = [req.currentStock.get(sku, 0) for sku in batch.skus]
 
-            # Use current stock from request (real inventory data from Node.js)
-            current_stock = req.currentStock.get(sku, 0)
+        # Calculate stock duration and urgency level
+        days_remaining = batch.days_remaining(current_stocks)
+        urgencies = urgency_levels(days_remaining)
 
-            # Calculate stock duration
-            days_remaining = current_stock / mean_demand if mean_demand > 0 else 999
+        # Calculate multiple quantity scenarios based on coverage duration, for all SKUs at once
+        all_scenarios = coverage_scenarios(batch.mean_demand.tolist(), current_stocks)
 
-            # Determine urgency level
-            if days_remaining < 3:
-                urgency = "CRITICAL"
-            elif days_remaining < 7:
-                urgency = "WARNING"
-            elif days_remaining < 30:
-                urgency = "GOOD"
-            else:
-                urgency = "OVERSTOCKED"
-
-            lead_time = req.leadTimes.get(sku, 7)
-
-            # Calculate ROP and safety stock
-            safety_stock = calculate_safety_stock(std_dev, lead_time, req.zScore)
-            rop = calculate_rop(mean_demand, lead_time, safety_stock)
-
-            # Calculate multiple quantity scenarios based on coverage duration
-            # Order enough to cover: 1 day, 1 week, 1 month
-            scenarios = []
-            coverage_periods = [
-                ("1 Day", 1),
-                ("1 Week", 7),
-                ("1 Month", 30)
-            ]
-            
-            for label, days_coverage in coverage_periods:
-                # Calculate order quantity to cover the specified period
-                order_qty = max(0, int(mean_demand * days_coverage) - current_stock)
-                projected_stock = current_stock + order_qty
-                projected_duration = projected_stock / mean_demand if mean_demand > 0 else 999
-
-                scenarios.append({
-                    "label": label,
-                    "orderQty": order_qty,
-                    "projectedStock": projected_stock,
-                    "projectedDuration": round(projected_duration, 2),
-                    "coverageDays": days_coverage
-                })
-
-            # Calculate next delivery (simplified - using lead time)
-            next_delivery = datetime.now() + timedelta(days=lead_time)
-
-            # Use 1-week coverage as the recommended quantity
-            recommended_qty = scenarios[1]["orderQty"] if len(scenarios) > 1 else 0
-            
-            suggestions.append({
-                "sku": sku,
-                "currentStock": current_stock,
-                "daysRemaining": round(days_remaining, 2),
-                "urgency": urgency,
-                "meanDemand": round(mean_demand, 2),
-                "stdDevDemand": round(std_dev, 2),
-                "rop": rop,
-                "safetyStock": safety_stock,
-                "scenarios": scenarios,
-                "recommendedQty": recommended_qty,
-                "analysisPeriodDays": req.analysisPeriodDays,
-                "nextDeliveryDate": next_delivery.isoformat(),
-                "reason": {
-                    "leadTimeDays": lead_time,
-                    "serviceLevel": req.serviceLevel,
-                    "zScore": req.zScore,
-                    "shouldReorder": current_stock <= rop,
-                    "analysisNote": f"Based on {req.analysisPeriodDays} days of historical data"
-                }
-            })
+        # Calculate next delivery (simplified - using lead time); SKUs mostly
+        # share a few lead times, so format each distinct date once
+        now = datetime.now()
+        delivery_dates = {
+            lead_time: (now + timedelta(days=lead_time)).isoformat()
+            for lead_time in set(batch.lead_time.tolist())
+        }
+
+        suggestions = [
+            build_enhanced_suggestion(
+                req, sku, mean_demand, std_dev, current_stock, lead_time, safety_stock, rop,
+                days, urgency, scenarios, delivery_dates[lead_time]
+            )
+            for (sku, mean_demand, std_dev, lead_time, safety_stock, rop), current_stock, days, urgency, scenarios
+            in zip(batch.rows(), current_stocks, days_remaining.tolist(), urgencies, all_scenarios)
+        ]
 
         return {
             "suggestions": suggestions,
-            "generatedAt": datetime.now().isoformat()
+            "generatedAt": now.isoformat()
         }
 
     except Exception as e:
@@ -465,7 +823,7 @@ async def get_metrics():
 # V3 API - Advanced Forecasting with ML
 # ==============================================================================
 
-from forecast_engine import ForecastEngine
+from forecast_engine import ForecastEngine, quick_forecast_many
 from supplier_engine import SupplierSchedule, SupplierOptimizer, PricingEngine
 from coverage_calculator import CoverageCalculator
 
@@ -532,6 +890,69 @@ pricing_engine = PricingEngine()
 supplier_optimizer = SupplierOptimizer(supplier_schedule, pricing_engine)
 coverage_calculator = CoverageCalculator()
 
+# Supplier comparisons are repeated for the same product by dashboards and
+# by the v3 endpoints; reuse one for a short while when every input matches
+SUPPLIER_CACHE_TTL_SECONDS = float(os.getenv("FORECAST_SUPPLIER_CACHE_TTL", "60"))
+
+
+def compare_suppliers_cached(
+    sku: str,
+    current_stock: float,
+    daily_demand: float,
+    order_quantity: int
+) -> Dict:
+    """supplier_optimizer.compare_suppliers, memoized on its exact inputs"""
+    # The comparison covers every price known for the SKU, not just the ones
+    # set by this request, and its order days depend on today's date
+    key = (
+        "suppliers", sku, frozenset(pricing_engine.get_all_prices(sku).items()),
+        current_stock, daily_demand, order_quantity, datetime.now().date()
+    )
+    result = cache_get(key)
+    if result is None:
+        result = supplier_optimizer.compare_suppliers(
+            sku, current_stock, daily_demand, order_quantity
+        )
+        cache_put(key, result, SUPPLIER_CACHE_TTL_SECONDS)
+    return result
+
+
+# Worker processes for forecast analysis of large v3 batches (0 or 1 = in-process).
+# Smaller batches aren't worth the pickling round-trip.
+FORECAST_PROCESSES = int(os.getenv("FORECAST_PROCESSES", "0"))
+PROCESS_POOL_MIN_SKUS = 200
+process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared forecast process pool (created on first use), or None if disabled"""
+    global process_pool
+    if FORECAST_PROCESSES <= 1:
+        return None
+    if process_pool is None:
+        process_pool = ProcessPoolExecutor(max_workers=FORECAST_PROCESSES)
+    return process_pool
+
+
+async def analyze_histories(histories: List[List[float]]) -> List[Dict]:
+    """
+    ForecastEngine.analyze for every history (results in order), off the event loop
+
+    Large batches are split into one chunk per worker process when
+    FORECAST_PROCESSES is set; otherwise the batch runs in a worker thread.
+    """
+    pool = get_process_pool() if len(histories) >= PROCESS_POOL_MIN_SKUS else None
+    if pool is None:
+        return await asyncio.to_thread(quick_forecast_many, histories)
+
+    loop = asyncio.get_running_loop()
+    chunk_size = -(-len(histories) // FORECAST_PROCESSES)
+    parts = await asyncio.gather(*[
+        loop.run_in_executor(pool, quick_forecast_many, histories[i:i + chunk_size])
+        for i in range(0, len(histories), chunk_size)
+    ])
+    return [result for part in parts for result in part]
+
 
 @app.post("/v3/recommendations", response_model=V3RecommendationResponse)
 async def generate_v3_recommendations(req: V3RecommendationRequest):
@@ -553,18 +974,24 @@ async def generate_v3_recommendations(req: V3RecommendationRequest):
             req.analysisPeriodDays
         )
         
+        skus = [sku for sku in req.skus if len(sales_history.get(sku, [])) >= 3]
+        
+        # Forecast analysis is pure CPU work per SKU; run it for all SKUs off
+        # the event loop so it keeps serving other requests meanwhile
+        if req.includeAnalysis:
+            forecast_results = await analyze_histories([sales_history[sku] for sku in skus])
+        else:
+            forecast_results = [None] * len(skus)
+        
         recommendations = []
+        now = datetime.now()
         
-        for sku in req.skus:
-            history = sales_history.get(sku, [])
-            if not history or len(history) < 3:
-                continue
-            
+        for sku, forecast_result in zip(skus, forecast_results):
+            history = sales_history[sku]
             current_stock = req.currentStock.get(sku, 0)
             
             # Step 1: Forecast Analysis
             if req.includeAnalysis:
-                forecast_result = forecast_engine.analyze(history)
                 pattern = forecast_result['classification']['pattern']
                 confidence = forecast_result['classification']['confidence']
                 trend = forecast_result['trend']
@@ -579,14 +1006,16 @@ async def generate_v3_recommendations(req: V3RecommendationRequest):
             # Step 2: Calculate Coverage
             current_coverage = coverage_calculator.calculate_current_coverage(
                 current_stock,
-                forecasted_demand
+                forecasted_demand,
+                now
             )
             
             # Step 3: Generate Coverage Scenarios
             scenarios = coverage_calculator.generate_scenarios(
                 current_stock,
                 forecasted_demand,
-                custom_periods=[1, 7, 14, 30]
+                custom_periods=[1, 7, 14, 30],
+                now=now
             )
             
             # Step 4: Get recommended order quantity
@@ -601,11 +1030,10 @@ async def generate_v3_recommendations(req: V3RecommendationRequest):
             supplier_options = []
             if sku in req.supplierPrices and req.supplierPrices[sku]:
                 # Set prices in pricing engine
-                for supplier_id, price in req.supplierPrices[sku].items():
-                    pricing_engine.set_price(sku, supplier_id, price)
+                pricing_engine.set_prices(sku, req.supplierPrices[sku])
                 
                 # Find optimal supplier
-                supplier_comparison = supplier_optimizer.compare_suppliers(
+                supplier_comparison = compare_suppliers_cached(
                     sku,
                     current_stock,
                     forecasted_demand,
@@ -648,29 +1076,31 @@ async def generate_v3_recommendations(req: V3RecommendationRequest):
             'analysisPeriodDays': req.analysisPeriodDays
         }
         
-        return V3RecommendationResponse(
-            recommendations=recommendations,
-            generatedAt=datetime.now().isoformat(),
-            summary=summary
-        )
+        # Plain dict: the response_model validates it once on the way out
+        return {
+            'recommendations': recommendations,
+            'generatedAt': now.isoformat(),
+            'summary': summary
+        }
     
     except Exception as e:
-        import traceback
         print(f"ERROR in v3/recommendations: {str(e)}")
         print(f"Traceback: {traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Action per coverage status; anything else (OVERSTOCKED) means REDUCE_ORDERS
+_ACTIONS = MappingProxyType({
+    'CRITICAL': 'ORDER_TODAY',
+    'URGENT': 'ORDER_TODAY',
+    'LOW': 'ORDER_SOON',
+    'GOOD': 'MONITOR'
+})
+
+
 def _determine_action(urgency: str) -> str:
     """Determine action based on urgency"""
-    if urgency in ['CRITICAL', 'URGENT']:
-        return 'ORDER_TODAY'
-    elif urgency == 'LOW':
-        return 'ORDER_SOON'
-    elif urgency == 'GOOD':
-        return 'MONITOR'
-    else:
-        return 'REDUCE_ORDERS'
+    return _ACTIONS.get(urgency, 'REDUCE_ORDERS')
 
 
 @app.post("/v3/coverage-scenarios")
@@ -720,11 +1150,10 @@ async def compare_suppliers(req: SupplierComparisonRequest):
     """
     try:
         # Set prices
-        for supplier_id, price in req.supplierPrices.items():
-            pricing_engine.set_price(req.sku, supplier_id, price)
+        pricing_engine.set_prices(req.sku, req.supplierPrices)
         
         # Get comparison
-        result = supplier_optimizer.compare_suppliers(
+        result = compare_suppliers_cached(
             req.sku,
             req.currentStock,
             req.dailyDemand,
@@ -744,6 +1173,54 @@ async def compare_suppliers(req: SupplierComparisonRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _daily_action_item(product: Dict[str, Any], now: datetime) -> Tuple[str, Dict[str, Any]]:
+    """(action, action-list entry) for one product of a daily action list request"""
+    sku = product['sku']
+    current_stock = product['currentStock']
+    daily_demand = product['dailyDemand']
+    
+    # Calculate coverage
+    coverage = coverage_calculator.calculate_current_coverage(
+        current_stock,
+        daily_demand,
+        now
+    )
+    
+    # Determine action
+    action = _determine_action(coverage['status'])
+    
+    # Get supplier options if prices provided
+    supplier_options = []
+    if 'supplierPrices' in product and product['supplierPrices']:
+        pricing_engine.set_prices(sku, product['supplierPrices'])
+        
+        supplier_comparison = compare_suppliers_cached(
+            sku,
+            current_stock,
+            daily_demand,
+            int(daily_demand * 7)  # 1 week default
+        )
+        supplier_options = supplier_comparison['all_options']
+    
+    return action, {
+        'sku': sku,
+        'currentStock': current_stock,
+        'daysRemaining': coverage['days_remaining'],
+        'urgency': coverage['status'],
+        'message': coverage['message'],
+        'supplierOptions': supplier_options
+    }
+
+
+# Summary field per action, in action-list order
+_ACTION_SUMMARY_KEYS = {
+    'ORDER_TODAY': 'orderToday',
+    'ORDER_SOON': 'orderSoon',
+    'MONITOR': 'monitor',
+    'REDUCE_ORDERS': 'reduceOrders'
+}
+
+
 @app.post("/v3/daily-action-list")
 async def get_daily_action_list(req: DailyActionListRequest):
     """
@@ -762,44 +1239,13 @@ async def get_daily_action_list(req: DailyActionListRequest):
             'MONITOR': [],
             'REDUCE_ORDERS': []
         }
+        now = datetime.now()
         
         for product in req.products:
-            sku = product['sku']
-            current_stock = product['currentStock']
-            daily_demand = product['dailyDemand']
-            
-            # Calculate coverage
-            coverage = coverage_calculator.calculate_current_coverage(
-                current_stock,
-                daily_demand
-            )
-            
-            # Determine action
-            action = _determine_action(coverage['status'])
-            
-            # Get supplier options if prices provided
-            supplier_options = []
-            if 'supplierPrices' in product and product['supplierPrices']:
-                for supplier_id, price in product['supplierPrices'].items():
-                    pricing_engine.set_price(sku, supplier_id, price)
-                
-                supplier_comparison = supplier_optimizer.compare_suppliers(
-                    sku,
-                    current_stock,
-                    daily_demand,
-                    int(daily_demand * 7)  # 1 week default
-                )
-                supplier_options = supplier_comparison['all_options']
+            action, item = _daily_action_item(product, now)
             
             # Add to appropriate list
-            action_list[action].append({
-                'sku': sku,
-                'currentStock': current_stock,
-                'daysRemaining': coverage['days_remaining'],
-                'urgency': coverage['status'],
-                'message': coverage['message'],
-                'supplierOptions': supplier_options
-            })
+            action_list[action].append(item)
         
         return {
             'storeId': req.storeId,
@@ -810,31 +1256,84 @@ async def get_daily_action_list(req: DailyActionListRequest):
                 'monitor': len(action_list['MONITOR']),
                 'reduceOrders': len(action_list['REDUCE_ORDERS'])
             },
-            'generatedAt': datetime.now().isoformat()
+            'generatedAt': now.isoformat()
         }
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/v3/daily-action-list/stream")
+async def stream_daily_action_list(req: DailyActionListRequest):
+    """
+    Daily action list as NDJSON, one line per product as soon as it's computed
+    
+    Product lines are {"action": ..., <same fields as /v3/daily-action-list>};
+    the last line is {"storeId", "summary", "generatedAt"}. The 200 status is
+    sent before any product is processed, so errors arrive as a final
+    {"error": ...} line instead.
+    """
+    async def lines():
+        summary = dict.fromkeys(_ACTION_SUMMARY_KEYS.values(), 0)
+        now = datetime.now()
+        try:
+            for product in req.products:
+                action, item = _daily_action_item(product, now)
+                summary[_ACTION_SUMMARY_KEYS[action]] += 1
+                yield orjson.dumps({'action': action, **item}, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+        except Exception as e:
+            yield orjson.dumps({'error': str(e)}) + b"\n"
+            return
+        
+        yield orjson.dumps({
+            'storeId': req.storeId,
+            'summary': summary,
+            'generatedAt': now.isoformat()
+        }) + b"\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Test API Core connectivity on startup"""
+    """Test api-core connectivity and start the forecast worker processes on startup"""
+    pool = get_process_pool()
+    if pool is not None:
+        # Start every worker with one tiny analysis now, so the first large
+        # v3 batch doesn't pay for process start-up
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(pool, quick_forecast_many, [[1.0] * 10])
+            for _ in range(FORECAST_PROCESSES)
+        ])
+        print(f"✓ Started {FORECAST_PROCESSES} forecast worker processes")
+    
     print("=" * 60)
     print("Testing API Core connectivity...")
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{API_CORE_URL}/health")
-            if response.status_code == 200:
-                print(f"✓ API Core reachable at {API_CORE_URL}")
-            else:
-                print(f"✗ API Core returned status {response.status_code}")
+        response = await get_http_client().get("/health", timeout=5.0)
+        if response.status_code == 200:
+            print(f"✓ API Core reachable at {API_CORE_URL}")
+        else:
+            print(f"✗ API Core returned status {response.status_code}")
     except Exception as e:
         print(f"✗ Cannot reach API Core: {e}")
         print(f"  Make sure API Core is running on {API_CORE_URL}")
     print("=" * 60)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared api-core client and forecast process pool"""
+    global http_client, process_pool
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+    if process_pool is not None:
+        process_pool.shutdown()
+        process_pool = None
+
+
 @app.get("/v3/health")
 async def v3_health_check():
     """Health check for V3 API with engine status"""
@@ -857,5 +1356,9 @@ if __name__ == "__main__":
     port = int(os.getenv("FORECAST_PORT", os.getenv("PORT", "18000")))
     if port == 14000:  # If root .env PORT=14000, use 18000 for forecast
         port = 18000
-    print(f"Starting Forecast Service on port {port}")
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    # uvicorn[standard] brings uvloop + httptools, which uvicorn's default
+    # loop="auto"/http="auto" already pick (falling back where uvloop is unavailable).
+    # FORECAST_WORKERS > 1 runs several processes; each keeps its own snapshot cache.
+    workers = int(os.getenv("FORECAST_WORKERS", "1"))
+    print(f"Starting Forecast Service on port {port} ({workers} worker(s))")
+    uvicorn.run("main:app" if workers > 1 else app, host="0.0.0.0", port=port, workers=workers)
\ No newline at end of file
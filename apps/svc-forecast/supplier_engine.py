@@ -10,8 +10,11 @@ Handles:
 """
 
 from datetime import datetime, timedelta
+from operator import itemgetter
+from sys import intern
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
+import numpy as np
 
 
 class DeliveryDay(Enum):
@@ -25,6 +28,9 @@ class DeliveryDay(Enum):
     SUNDAY = 6
 
 
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+
 class Supplier:
     """Supplier configuration"""
     
@@ -45,25 +51,20 @@ class Supplier:
         self.cutoff_time = cutoff_time
         self.reliability = reliability
         self.notes = notes
+        
+        # Days from each weekday to the next order day (0 = can order that day)
+        self._next_order_offset = tuple(
+            next((k for k in range(7) if (weekday + k) % 7 in order_days), 7)
+            for weekday in range(7)
+        )
     
     def can_order_today(self, date: datetime) -> bool:
         """Check if orders can be placed today"""
-        day_of_week = date.weekday()  # 0=Monday, 6=Sunday
-        return day_of_week in self.order_days
+        return self._next_order_offset[date.weekday()] == 0
     
     def next_order_date(self, from_date: datetime) -> datetime:
         """Find next available order date"""
-        if self.can_order_today(from_date):
-            return from_date
-        
-        # Find next valid day
-        for i in range(1, 8):
-            next_date = from_date + timedelta(days=i)
-            if self.can_order_today(next_date):
-                return next_date
-        
-        # Should never reach here, but fallback
-        return from_date + timedelta(days=7)
+        return from_date + timedelta(days=self._next_order_offset[from_date.weekday()])
     
     def delivery_date(self, order_date: datetime) -> datetime:
         """Calculate delivery date from order date"""
@@ -71,11 +72,10 @@ class Supplier:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         return {
             'id': self.id,
             'name': self.name,
-            'order_days': [day_names[i] for i in self.order_days],
+            'order_days': [DAY_NAMES[i] for i in self.order_days],
             'lead_time_days': self.lead_time_days,
             'cutoff_time': self.cutoff_time,
             'reliability': self.reliability,
@@ -116,6 +116,7 @@ class SupplierSchedule:
     
     def add_supplier(self, supplier: Supplier):
         """Add or update a supplier"""
+        supplier.id = intern(supplier.id)
         self.suppliers[supplier.id] = supplier
     
     def get_supplier(self, supplier_id: str) -> Optional[Supplier]:
@@ -149,11 +150,24 @@ class PricingEngine:
     def __init__(self):
         self.prices: Dict[str, Dict[str, float]] = {}  # {sku: {supplier_id: price}}
     
+    @classmethod
+    def from_single_sku(cls, sku: str, prices: Dict[str, float]) -> 'PricingEngine':
+        """Pricing engine holding prices for one product only"""
+        engine = cls()
+        engine.prices = {sku: {intern(sid): price for sid, price in prices.items()}}
+        return engine
+    
     def set_price(self, sku: str, supplier_id: str, price: float):
         """Set price for product from supplier"""
         if sku not in self.prices:
             self.prices[sku] = {}
-        self.prices[sku][supplier_id] = price
+        self.prices[sku][intern(supplier_id)] = price
+    
+    def set_prices(self, sku: str, prices: Dict[str, float]):
+        """Set prices for product from several suppliers at once"""
+        self.prices.setdefault(sku, {}).update(
+            (intern(supplier_id), price) for supplier_id, price in prices.items()
+        )
     
     def get_price(self, sku: str, supplier_id: str) -> Optional[float]:
         """Get price for product from supplier"""
@@ -191,7 +205,25 @@ class PricingEngine:
                 'extra_cost_percent': savings_percent
             })
         
-        return sorted(comparisons, key=lambda x: x['price'])
+        return sorted(comparisons, key=itemgetter('price'))
+    
+    def to_matrix(self, skus: List[str], supplier_ids: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prices as a (len(skus), len(supplier_ids)) array plus a mask of which
+        entries are set (unset entries are NaN)
+        """
+        prices = np.full((len(skus), len(supplier_ids)), np.nan)
+        columns = {supplier_id: j for j, supplier_id in enumerate(supplier_ids)}
+        for i, sku in enumerate(skus):
+            for supplier_id, price in self.prices.get(sku, {}).items():
+                j = columns.get(supplier_id)
+                if j is not None:
+                    prices[i, j] = price
+        return prices, ~np.isnan(prices)
+
+
+# Risk levels by the level codes calculate_risk_batch returns
+RISK_LEVELS = ('NONE', 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
 
 
 class RiskAssessor:
@@ -250,6 +282,44 @@ class RiskAssessor:
             'safe_days_needed': safe_days_needed,
             'message': message
         }
+    
+    @staticmethod
+    def calculate_risk_batch(
+        current_stocks: np.ndarray,
+        daily_demands: np.ndarray,
+        days_until_delivery: np.ndarray,
+        safety_factor: float = 1.2
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        calculate_risk over arrays (broadcast against each other)
+        
+        Returns (scores, levels, days_remaining); levels are int8 indices into
+        RISK_LEVELS. Messages are left to callers that need them.
+        """
+        stocks = np.asarray(current_stocks, dtype=float)
+        demands = np.asarray(daily_demands, dtype=float)
+        days = np.asarray(days_until_delivery, dtype=float)
+        
+        has_demand = demands > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            days_remaining = np.where(has_demand, stocks / demands, np.inf)
+        
+        conditions = [
+            days_remaining >= days * safety_factor,
+            days_remaining >= days,
+            days_remaining >= days * 0.7,
+            days_remaining >= days * 0.4,
+        ]
+        scores = np.select(conditions, [0.0, 0.3, 0.6, 0.8], default=1.0)
+        levels = np.select(conditions, [0, 1, 2, 3], default=4).astype(np.int8)
+        
+        return scores, levels, np.where(has_demand, days_remaining, 999.0)
+
+
+# Supplier score weights (score = risk * RISK_WEIGHT + total cost
+# + (1 - reliability) * RELIABILITY_WEIGHT, lower is better)
+RISK_WEIGHT = 1000  # Heavy penalty for risk
+RELIABILITY_WEIGHT = 100
 
 
 class SupplierOptimizer:
@@ -272,41 +342,56 @@ class SupplierOptimizer:
         """
         Find optimal supplier considering cost, timing, and risk
         
-        Returns sorted list of supplier options (best first)
+        Returns sorted list of supplier options (best first). Their order and
+        delivery dates are datetimes; the API's JSON encoding formats them as
+        ISO 8601, the same as isoformat().
         """
+        return self._rank_suppliers(
+            sku, current_stock, daily_demand, order_quantity, from_date, available_suppliers
+        )[0]
+    
+    def _rank_suppliers(
+        self,
+        sku: str,
+        current_stock: float,
+        daily_demand: float,
+        order_quantity: int,
+        from_date: Optional[datetime] = None,
+        available_suppliers: Optional[List[str]] = None
+    ) -> Tuple[List[Dict], float]:
+        """find_optimal_supplier's options plus the highest total cost among them"""
         if from_date is None:
             from_date = datetime.now()
         
-        # Get available suppliers
-        if available_suppliers is None:
-            suppliers = self.supplier_schedule.list_suppliers()
-        else:
-            suppliers = [self.supplier_schedule.get_supplier(sid) for sid in available_suppliers]
-            suppliers = [s for s in suppliers if s is not None]
-        
+        suppliers = self._select_suppliers(available_suppliers)
         if not suppliers:
-            return []
+            return [], 0.0
         
         options = []
+        most_expensive = 0.0
+        weekday = from_date.weekday()
+        get_price = self.pricing_engine.get_price
+        calculate_risk = self.risk_assessor.calculate_risk
         
         for supplier in suppliers:
             # Get price
-            price = self.pricing_engine.get_price(sku, supplier.id)
+            price = get_price(sku, supplier.id)
             if price is None:
                 continue  # Skip if no price available
             
             # Calculate order and delivery dates
-            order_date = supplier.next_order_date(from_date)
-            delivery_date = supplier.delivery_date(order_date)
-            
-            days_until_order = (order_date - from_date).days
-            days_until_delivery = (delivery_date - from_date).days
+            days_until_order = supplier._next_order_offset[weekday]
+            days_until_delivery = days_until_order + supplier.lead_time_days
+            order_date = from_date + timedelta(days=days_until_order)
+            delivery_date = from_date + timedelta(days=days_until_delivery)
             
             # Calculate cost
             total_cost = price * order_quantity
+            if not options or total_cost > most_expensive:
+                most_expensive = total_cost
             
             # Assess risk
-            risk = self.risk_assessor.calculate_risk(
+            risk = calculate_risk(
                 current_stock,
                 daily_demand,
                 days_until_delivery
@@ -314,17 +399,17 @@ class SupplierOptimizer:
             
             # Calculate score (lower is better)
             # Factors: risk (70%), cost (20%), reliability (10%)
-            risk_penalty = risk['score'] * 1000  # Heavy penalty for risk
+            risk_penalty = risk['score'] * RISK_WEIGHT
             cost_score = total_cost
-            reliability_penalty = (1 - supplier.reliability) * 100
+            reliability_penalty = (1 - supplier.reliability) * RELIABILITY_WEIGHT
             
             total_score = risk_penalty + cost_score + reliability_penalty
             
             options.append({
                 'supplier_id': supplier.id,
                 'supplier_name': supplier.name,
-                'order_date': order_date.isoformat(),
-                'delivery_date': delivery_date.isoformat(),
+                'order_date': order_date,
+                'delivery_date': delivery_date,
                 'days_until_order': days_until_order,
                 'days_until_delivery': days_until_delivery,
                 'unit_price': price,
@@ -333,19 +418,77 @@ class SupplierOptimizer:
                 'risk': risk,
                 'reliability': supplier.reliability,
                 'score': total_score,
-                'can_order_today': supplier.can_order_today(from_date),
+                'can_order_today': days_until_order == 0,
                 'notes': supplier.notes
             })
         
         # Sort by score (lower is better)
-        options.sort(key=lambda x: x['score'])
+        options.sort(key=itemgetter('score'))
         
         # Add recommendation tags
         if options:
             options[0]['recommended'] = True
             options[0]['reason'] = self._generate_recommendation_reason(options[0])
         
-        return options
+        return options, most_expensive
+    
+    def find_optimal_suppliers_bulk(
+        self,
+        skus: List[str],
+        current_stocks: List[float],
+        daily_demands: List[float],
+        order_quantities: List[int],
+        from_date: Optional[datetime] = None,
+        available_suppliers: Optional[List[str]] = None
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Score every (SKU, supplier) pair at once, as find_optimal_supplier does
+        for one SKU
+        
+        Returns (supplier_ids, scores, best): scores has one row per SKU and one
+        column per supplier (inf where the supplier has no price for the SKU),
+        best is each row's best column, or -1 if no supplier has a price.
+        """
+        if from_date is None:
+            from_date = datetime.now()
+        
+        suppliers = self._select_suppliers(available_suppliers)
+        supplier_ids = [s.id for s in suppliers]
+        prices, priced = self.pricing_engine.to_matrix(skus, supplier_ids)
+        
+        # Delivery timing and reliability depend only on the supplier
+        weekday = from_date.weekday()
+        days_until_delivery = np.array([
+            s._next_order_offset[weekday] + s.lead_time_days for s in suppliers
+        ], dtype=float)
+        reliabilities = np.array([s.reliability for s in suppliers], dtype=float)
+        
+        # Risk score per pair
+        risk_scores = self.risk_assessor.calculate_risk_batch(
+            np.asarray(current_stocks, dtype=float)[:, None],
+            np.asarray(daily_demands, dtype=float)[:, None],
+            days_until_delivery
+        )[0]
+        
+        # Calculate score (lower is better)
+        total_costs = prices * np.asarray(order_quantities, dtype=float)[:, None]
+        scores = risk_scores * RISK_WEIGHT
+        scores += total_costs
+        scores += (1 - reliabilities) * RELIABILITY_WEIGHT
+        scores[~priced] = np.inf
+        
+        if not suppliers:
+            best = np.full(len(skus), -1)
+        else:
+            best = np.where(priced.any(axis=1), scores.argmin(axis=1), -1)
+        return supplier_ids, scores, best
+    
+    def _select_suppliers(self, available_suppliers: Optional[List[str]]) -> List[Supplier]:
+        """Suppliers to consider: all of them, or the known ones among available_suppliers"""
+        if available_suppliers is None:
+            return self.supplier_schedule.list_suppliers()
+        suppliers = [self.supplier_schedule.get_supplier(sid) for sid in available_suppliers]
+        return [s for s in suppliers if s is not None]
     
     def _generate_recommendation_reason(self, option: Dict) -> str:
         """Generate human-readable recommendation reason"""
@@ -386,7 +529,7 @@ class SupplierOptimizer:
         
         Returns detailed comparison with savings calculations
         """
-        options = self.find_optimal_supplier(
+        options, most_expensive = self._rank_suppliers(
             sku, current_stock, daily_demand, order_quantity, from_date
         )
         
@@ -397,11 +540,10 @@ class SupplierOptimizer:
             }
         
         # Calculate savings vs most expensive
-        most_expensive = max(opt['total_cost'] for opt in options)
-        
         for opt in options:
-            opt['savings_vs_max'] = most_expensive - opt['total_cost']
-            opt['savings_percent'] = (opt['savings_vs_max'] / most_expensive * 100) if most_expensive > 0 else 0
+            savings = most_expensive - opt['total_cost']
+            opt['savings_vs_max'] = savings
+            opt['savings_percent'] = (savings / most_expensive * 100) if most_expensive > 0 else 0
         
         best_option = options[0]
         
@@ -415,12 +557,24 @@ class SupplierOptimizer:
 
 
 # Convenience functions
+_default_schedule: Optional[SupplierSchedule] = None
+
+
+def default_schedule() -> SupplierSchedule:
+    """Shared SupplierSchedule with the default suppliers (created on first use)"""
+    global _default_schedule
+    if _default_schedule is None:
+        _default_schedule = SupplierSchedule()
+    return _default_schedule
+
+
 def quick_supplier_comparison(
     sku: str,
     current_stock: float,
     daily_demand: float,
     order_quantity: int,
-    prices: Dict[str, float]  # {supplier_id: price}
+    prices: Dict[str, float],  # {supplier_id: price}
+    schedule: Optional[SupplierSchedule] = None
 ) -> Dict:
     """
     Quick supplier comparison
@@ -435,13 +589,12 @@ def quick_supplier_comparison(
         )
         print(result['recommended']['supplier_name'])
         print(f"Savings: €{result['max_savings']:.2f}")
-    """
-    schedule = SupplierSchedule()
-    pricing = PricingEngine()
     
-    # Set prices
-    for supplier_id, price in prices.items():
-        pricing.set_price(sku, supplier_id, price)
+    Uses the default suppliers unless a schedule is given.
+    """
+    if schedule is None:
+        schedule = default_schedule()
+    pricing = PricingEngine.from_single_sku(sku, prices)
     
     optimizer = SupplierOptimizer(schedule, pricing)
     return optimizer.compare_suppliers(sku, current_stock, daily_demand, order_quantity)